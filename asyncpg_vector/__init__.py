@@ -7,15 +7,22 @@ PostgreSQL client `asyncpg`, and marshals vector data to and from PostgreSQL dat
 :see: https://github.com/hunyadi/asyncpg_vector
 """
 
+import array
 import base64
+import functools
+import operator
+import struct
 import sys
 from abc import ABC, abstractmethod
 from collections.abc import Sequence
-from struct import pack, unpack
-from typing import ClassVar
+from itertools import compress, repeat
+from typing import TYPE_CHECKING, Any, ClassVar
 
 import asyncpg
 
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
 if sys.version_info >= (3, 11):
     from typing import Self
 else:
@@ -26,6 +33,11 @@ if sys.version_info >= (3, 12):
 else:
     from typing_extensions import override
 
+if sys.version_info >= (3, 13):
+    from typing import TypeIs
+else:
+    from typing_extensions import TypeIs
+
 __version__ = "0.1.0"
 __author__ = "Levente Hunyadi"
 __copyright__ = "Copyright 2025, Levente Hunyadi"
@@ -33,6 +45,32 @@ __license__ = "MIT"
 __maintainer__ = "Levente Hunyadi"
 __status__ = "Production"
 
+_HEADER = struct.Struct(">HH")
+"Header of dense vector types in the PostgreSQL data transfer representation: dimension count and an unused field."
+
+_SPARSE_HEADER = struct.Struct(">iii")
+"Header of sparse vector types in the PostgreSQL data transfer representation: dimension count, non-zero count and an unused field."
+
+_BIT_HEADER = struct.Struct(">i")
+"Header of the bit string type in the PostgreSQL data transfer representation: bit count."
+
+_BIT_DIGITS = bytes.maketrans(b"\x00\x01", b"01")
+"Maps bytes of value 0 and 1 to binary digits."
+
+
+@functools.lru_cache(maxsize=256)
+def _packer(count: int, code: str) -> struct.Struct:
+    "Returns a (cached) pre-compiled big-endian packer for `count` items of the given `struct` type code."
+
+    return struct.Struct(f">{count}{code}")
+
+
+def _is_numpy_array(obj: object) -> "TypeIs[npt.NDArray[Any]]":
+    "True if the object is a NumPy array. Checked without importing `numpy`."
+
+    obj_type = type(obj)
+    return obj_type.__name__ == "ndarray" and obj_type.__module__ == "numpy"
+
 
 class BasicVector(ABC):
     "Base class for PostgreSQL vector types."
@@ -49,24 +87,37 @@ class BasicVector(ABC):
 
         ...
 
+    def to_float_sequence(self) -> Sequence[float]:
+        """
+        Converts the vector to a read-only sequence of double-precision floating-point values.
+
+        Unlike `to_float_list`, the result may be a more compact type than `list`, which avoids an extra copy when the
+        caller does not mutate the items.
+        """
+
+        return self.to_float_list()
+
     @classmethod
     @abstractmethod
-    def from_float_list(cls, vec: Sequence[float]) -> Self:
-        "Creates a vector from a list of double-precision floating-point numbers."
+    def from_float_list(cls, vec: "Sequence[float] | npt.NDArray[Any]") -> Self:
+        "Creates a vector from a list (or one-dimensional NumPy array) of double-precision floating-point numbers."
 
         ...
 
     @classmethod
     def from_float_base64(cls, base64_encoded: str) -> Self:
         """
-        Creates a vector from a base64-encoded string storing a list of double-precision floating-point numbers.
+        Creates a vector from a base64-encoded string storing a list of single-precision floating-point numbers.
 
-        This allows lossless transition of a floating-point value between APIs.
+        Items are expected in little-endian byte order. This allows lossless transition of a floating-point value
+        between APIs.
         """
 
-        decoded_bytes = base64.b64decode(base64_encoded)
-        float_tuple = unpack(f"{len(decoded_bytes) // 4}f", decoded_bytes)
-        return cls.from_float_list(float_tuple)
+        items = array.array("f")
+        items.frombytes(base64.b64decode(base64_encoded))
+        if sys.byteorder == "big":
+            items.byteswap()
+        return cls.from_float_list(items)
 
     @abstractmethod
     def to_database_binary(self) -> bytes:
@@ -74,6 +125,18 @@ class BasicVector(ABC):
 
         ...
 
+    def to_database_binary_into(self, buffer: bytearray | memoryview, offset: int = 0) -> int:
+        """
+        Writes the data into a pre-allocated buffer in the PostgreSQL data transfer representation.
+
+        :returns: Offset in the buffer past the last byte written.
+        """
+
+        data = self.to_database_binary()
+        end = offset + len(data)
+        buffer[offset:end] = data
+        return end
+
     @classmethod
     @abstractmethod
     def from_database_binary(cls, data: bytes) -> Self:
@@ -82,9 +145,13 @@ class BasicVector(ABC):
         ...
 
     @classmethod
-    def _to_database_binary(cls, value: Self | list[float] | None) -> bytes | None:
+    def _to_database_binary(cls, value: "Self | list[float] | npt.NDArray[Any] | None") -> bytes | None:
         "Writes a value or instance into the PostgreSQL data transfer representation."
 
+        # fast path for the most common case, an instance of the registered type, skips pattern matching
+        if type(value) is cls:
+            return value.to_database_binary()
+
         if value is None:
             return value  # asyncpg uses `None` for representing SQL `NULL`
 
@@ -100,6 +167,8 @@ class BasicVector(ABC):
                     obj = cls.from_float_list(value)
                 else:
                     obj = cls()
+            case _ if _is_numpy_array(value):
+                obj = cls.from_float_list(value)
             case _:
                 raise ValueError(f"unsupported type: {type(value).__name__}")
 
@@ -118,50 +187,155 @@ class BasicVector(ABC):
 class DenseVector(BasicVector):
     "Base class for PostgreSQL dense vector types."
 
-    __slots__ = ("_data",)
+    __slots__ = ("_data", "_size", "_wire", "_hash")
+
+    _data: bytes | memoryview
+    _size: int
+    _wire: bytes | None
+    _hash: int | None
+
+    _bytes_per_item: ClassVar[int]
+    "Number of bytes per item in the vector."
 
-    _data: bytes
+    _numpy_dtype: ClassVar[str]
+    "NumPy data type of the PostgreSQL data transfer representation."
 
-    def __init__(self, data: bytes | None = None) -> None:
+    def __init__(self, data: bytes | memoryview | None = None) -> None:
         if data is not None:
             self._data = data
         else:
             self._data = bytes()
+        self._size = len(self._data) // self._bytes_per_item
+        self._wire = None
+        self._hash = None
 
     def __eq__(self, value: object) -> bool:
         if not isinstance(value, self.__class__):
             return False
 
+        if self._size != value._size:
+            return False
+
         return self._data == value._data
 
+    def __hash__(self) -> int:
+        h = self._hash
+        if h is None:
+            h = self._hash = hash(bytes(self._data))
+        return h
+
+    def __reduce__(self) -> tuple[type[Self], tuple[bytes]]:
+        return type(self), (bytes(self._data),)
+
     def __str__(self) -> str:
         return f"{type(self).__name__}(size={self.size()})"
 
     def __repr__(self) -> str:
-        return f"{type(self).__name__}({self._data!r})"
+        return f"{type(self).__name__}({bytes(self._data)!r})"
 
     @override
     def size(self) -> int:
-        return len(self._data) // self.bytes_per_item()
+        return self._size
 
     @classmethod
-    @abstractmethod
     def bytes_per_item(cls) -> int:
         "Number of bytes per item in the vector."
 
-        ...
+        return cls._bytes_per_item
+
+    def to_numpy(self) -> "npt.NDArray[Any]":
+        """
+        Converts the vector to a NumPy array of native byte order.
+
+        Requires the package `numpy` to be installed.
+        """
+
+        import numpy as np
+
+        data_type = np.dtype(self._numpy_dtype)
+        return np.frombuffer(self._data, dtype=data_type).astype(data_type.newbyteorder("="))
+
+    @classmethod
+    def from_numpy(cls, arr: "npt.NDArray[Any]") -> Self:
+        """
+        Creates a vector from a one-dimensional NumPy array.
+
+        Items are converted in bulk, without creating intermediate Python `float` objects.
+        """
+
+        if arr.ndim != 1:
+            raise ValueError(f"expected: one-dimensional array; got: {arr.ndim} dimensions")
+        return cls(cls._convert_numpy(arr).tobytes())
+
+    @classmethod
+    def _convert_numpy(cls, arr: "npt.NDArray[Any]") -> "npt.NDArray[Any]":
+        """
+        Converts a NumPy array to the data type of the PostgreSQL data transfer representation.
+
+        Raises `OverflowError` for finite values out of range, matching the behavior for lists of floats.
+        """
+
+        import numpy as np
+
+        with np.errstate(over="ignore"):
+            items = arr.astype(cls._numpy_dtype, copy=False)
+        infinite = np.isinf(items)
+        if infinite.any() and (infinite & np.isfinite(arr)).any():
+            raise OverflowError(f"float too large to convert to {items.dtype}")
+        return items
+
+    @classmethod
+    def encode_batch(cls, arr: "npt.NDArray[Any]") -> list[bytes]:
+        """
+        Writes each row of a two-dimensional NumPy array into the PostgreSQL data transfer representation.
+
+        All rows are converted in a single NumPy call. The resulting objects may be passed to `asyncpg` as query
+        parameters in place of vector instances.
+        """
+
+        if arr.ndim != 2:
+            raise ValueError(f"expected: two-dimensional array; got: {arr.ndim} dimensions")
+        rows = cls._convert_numpy(arr)
+        header = _HEADER.pack(arr.shape[1], 0)
+        return [header + row.tobytes() for row in rows]
 
     @override
     def to_database_binary(self) -> bytes:
-        return pack(">HH", self.size(), 0) + self._data
+        # vectors are immutable, the representation is computed once and re-used for repeated writes
+        wire = self._wire
+        if wire is None:
+            wire = self._wire = _HEADER.pack(self._size, 0) + self._data
+        return wire
+
+    @override
+    def to_database_binary_into(self, buffer: bytearray | memoryview, offset: int = 0) -> int:
+        _HEADER.pack_into(buffer, offset, self._size, 0)
+        start = offset + _HEADER.size
+        end = start + len(self._data)
+        buffer[start:end] = self._data
+        return end
 
     @override
     @classmethod
     def from_database_binary(cls, data: bytes) -> Self:
-        size, _unused = unpack(">HH", data[0:4])
-        if len(data) != 4 + cls.bytes_per_item() * size:
-            raise ValueError(f"expected size: {cls.bytes_per_item()} * {size}; got {len(data) - 4} bytes")
-        return cls(data[4:])
+        size, _unused = _HEADER.unpack_from(data, 0)
+        if len(data) != 4 + cls._bytes_per_item * size:
+            raise ValueError(f"expected size: {cls._bytes_per_item} * {size}; got {len(data) - 4} bytes")
+        return cls(memoryview(data)[_HEADER.size :])
+
+    @override
+    @classmethod
+    def _to_database_binary(cls, value: "Self | list[float] | npt.NDArray[Any] | bytes | None") -> bytes | None:
+        if isinstance(value, bytes):
+            # already in data transfer representation, e.g. produced by `encode_batch`
+            if len(value) < _HEADER.size:
+                raise ValueError(f"expected: at least {_HEADER.size} bytes; got {len(value)} bytes")
+            size, _unused = _HEADER.unpack_from(value, 0)
+            if len(value) != _HEADER.size + cls._bytes_per_item * size:
+                raise ValueError(f"expected size: {cls._bytes_per_item} * {size}; got {len(value) - _HEADER.size} bytes")
+            return value
+
+        return super()._to_database_binary(value)
 
 
 class HalfVector(DenseVector):
@@ -169,20 +343,23 @@ class HalfVector(DenseVector):
 
     type_name: ClassVar[str] = "halfvec"
     cosine_similarity: ClassVar[str] = "halfvec_cosine_ops"
+    _bytes_per_item: ClassVar[int] = 2
+    _numpy_dtype: ClassVar[str] = ">f2"
 
     @override
-    @classmethod
-    def bytes_per_item(cls) -> int:
-        return 2
+    def to_float_list(self) -> list[float]:
+        return list(self.to_float_sequence())
 
     @override
-    def to_float_list(self) -> list[float]:
-        return list(unpack(f">{self.size()}e", self._data))
+    def to_float_sequence(self) -> tuple[float, ...]:
+        return _packer(self._size, "e").unpack(self._data)
 
     @override
     @classmethod
-    def from_float_list(cls, vec: Sequence[float]) -> Self:
-        return cls(pack(f">{len(vec)}e", *vec))
+    def from_float_list(cls, vec: "Sequence[float] | npt.NDArray[Any]") -> Self:
+        if _is_numpy_array(vec):
+            return cls.from_numpy(vec)
+        return cls(_packer(len(vec), "e").pack(*vec))
 
 
 class Vector(DenseVector):
@@ -190,40 +367,53 @@ class Vector(DenseVector):
 
     type_name: ClassVar[str] = "vector"
     cosine_similarity: ClassVar[str] = "vector_cosine_ops"
+    _bytes_per_item: ClassVar[int] = 4
+    _numpy_dtype: ClassVar[str] = ">f4"
 
     @override
-    @classmethod
-    def bytes_per_item(cls) -> int:
-        return 4
+    def to_float_list(self) -> list[float]:
+        return self.to_float_sequence().tolist()
 
     @override
-    def to_float_list(self) -> list[float]:
-        return list(unpack(f">{self.size()}f", self._data))
+    def to_float_sequence(self) -> "array.array[float]":
+        items = array.array("f")
+        items.frombytes(self._data)
+        if sys.byteorder == "little":
+            items.byteswap()
+        return items
 
     @override
     @classmethod
-    def from_float_list(cls, vec: Sequence[float]) -> Self:
-        return cls(pack(f">{len(vec)}f", *vec))
+    def from_float_list(cls, vec: "Sequence[float] | npt.NDArray[Any]") -> Self:
+        if _is_numpy_array(vec):
+            return cls.from_numpy(vec)
+        return cls(_packer(len(vec), "f").pack(*vec))
 
     @override
     @classmethod
     def from_float_base64(cls, base64_encoded: str) -> Self:
-        return cls(base64.b64decode(base64_encoded))
+        # swapping bytes converts little-endian input into big-endian storage independently of host byte order
+        items = array.array("f")
+        items.frombytes(base64.b64decode(base64_encoded))
+        items.byteswap()
+        return cls(items.tobytes())
 
 
 class SparseVector(BasicVector):
     "Implements the PostgreSQL extension type `sparsevec`."
 
-    __slots__ = ("_size", "_indices", "_values")
+    __slots__ = ("_size", "_nnz", "_indices", "_values", "_hash")
 
     _size: int
-    _indices: bytes
-    _values: bytes
+    _nnz: int
+    _indices: bytes | memoryview
+    _values: bytes | memoryview
+    _hash: int | None
 
     type_name: ClassVar[str] = "sparsevec"
     cosine_similarity: ClassVar[str] = "sparsevec_cosine_ops"
 
-    def __init__(self, size: int | None = None, indices: bytes | None = None, values: bytes | None = None) -> None:
+    def __init__(self, size: int | None = None, indices: bytes | memoryview | None = None, values: bytes | memoryview | None = None) -> None:
         if size is not None and indices is not None and values is not None:
             self._size = size
             self._indices = indices
@@ -236,58 +426,215 @@ class SparseVector(BasicVector):
             self._values = bytes()
         else:
             raise ValueError("expected: either all of `size`, `indices` and `values`, or neither")
+        self._nnz = len(self._indices) // 4
+        self._hash = None
 
     def __eq__(self, value: object) -> bool:
         if not isinstance(value, self.__class__):
             return False
 
-        return self._size == value._size and self._indices == value._indices and self._values == value._values
+        if self._size != value._size or self._nnz != value._nnz:
+            return False
+
+        return self._indices == value._indices and self._values == value._values
+
+    def __hash__(self) -> int:
+        h = self._hash
+        if h is None:
+            h = self._hash = hash((self._size, bytes(self._indices), bytes(self._values)))
+        return h
+
+    def __reduce__(self) -> tuple[type[Self], tuple[int, bytes, bytes]]:
+        return type(self), (self._size, bytes(self._indices), bytes(self._values))
 
     def __str__(self) -> str:
         return f"{type(self).__name__}(size={self.size()}, nnz={self.nnz()})"
 
     def __repr__(self) -> str:
-        return f"{type(self).__name__}(size={self.size()}, indices={self._indices!r}, values={self._values!r})"
+        return f"{type(self).__name__}(size={self.size()}, indices={bytes(self._indices)!r}, values={bytes(self._values)!r})"
 
     @override
     def size(self) -> int:
         return self._size
 
     def nnz(self) -> int:
-        return len(self._indices) // 4
+        return self._nnz
 
     @override
     def to_float_list(self) -> list[float]:
-        count = self.nnz()
-        indices = unpack(f">{count}i", self._indices)
-        values = unpack(f">{count}f", self._values)
-        items = [0.0 for _ in range(self._size)]
+        indices = array.array("i")
+        indices.frombytes(self._indices)
+        values = array.array("f")
+        values.frombytes(self._values)
+        if sys.byteorder == "little":
+            indices.byteswap()
+            values.byteswap()
+        items = [0.0] * self._size
         for index, value in zip(indices, values, strict=True):
             items[index] = value
         return items
 
     @override
     @classmethod
-    def from_float_list(cls, vec: Sequence[float]) -> Self:
-        indices = [index for index, value in enumerate(vec) if value != 0]
-        values = [vec[index] for index in indices]
-        count = len(indices)
-        return cls(len(vec), pack(f">{count}i", *indices), pack(f">{count}f", *values))
+    def from_float_list(cls, vec: "Sequence[float] | npt.NDArray[Any]") -> Self:
+        # `compress` selects items whose value is non-zero (i.e. truthy)
+        indices = array.array("i", compress(range(len(vec)), vec))
+        if sys.byteorder == "little":
+            indices.byteswap()
+        values = list(compress(vec, vec))
+        return cls(len(vec), indices.tobytes(), _packer(len(values), "f").pack(*values))
+
+    @override
+    def to_database_binary(self) -> bytes:
+        return b"".join((_SPARSE_HEADER.pack(self._size, self._nnz, 0), self._indices, self._values))
+
+    @override
+    def to_database_binary_into(self, buffer: bytearray | memoryview, offset: int = 0) -> int:
+        _SPARSE_HEADER.pack_into(buffer, offset, self._size, self._nnz, 0)
+        start = offset + _SPARSE_HEADER.size
+        middle = start + len(self._indices)
+        end = middle + len(self._values)
+        buffer[start:middle] = self._indices
+        buffer[middle:end] = self._values
+        return end
+
+    @override
+    @classmethod
+    def from_database_binary(cls, data: bytes) -> Self:
+        size, count, _ = _SPARSE_HEADER.unpack_from(data, 0)
+        view = memoryview(data)
+        middle = _SPARSE_HEADER.size + 4 * count
+        return cls(size, view[_SPARSE_HEADER.size : middle], view[middle:])
+
+
+class BitVector(BasicVector):
+    """
+    Implements the PostgreSQL type `bit` as a binary quantized vector.
+
+    Each dimension is stored on a single bit, set if the corresponding floating-point value is positive. Bits are packed
+    most significant bit first, with the last byte padded with zeros.
+    """
+
+    __slots__ = ("_size", "_data", "_hash")
+
+    _size: int
+    _data: bytes | memoryview
+    _hash: int | None
+
+    type_name: ClassVar[str] = "bit"
+    hamming_distance: ClassVar[str] = "bit_hamming_ops"
+
+    def __init__(self, size: int | None = None, data: bytes | memoryview | None = None) -> None:
+        if size is not None and data is not None:
+            self._size = size
+            self._data = data
+            if len(self._data) != (size + 7) // 8:
+                raise ValueError(f"expected: `data` of len {(size + 7) // 8} for {size} bits; got: {len(self._data)}")
+        elif size is None and data is None:
+            self._size = 0
+            self._data = bytes()
+        else:
+            raise ValueError("expected: either both `size` and `data`, or neither")
+        self._hash = None
+
+    def __eq__(self, value: object) -> bool:
+        if not isinstance(value, self.__class__):
+            return False
+
+        if self._size != value._size:
+            return False
+
+        return self._data == value._data
+
+    def __hash__(self) -> int:
+        h = self._hash
+        if h is None:
+            h = self._hash = hash((self._size, bytes(self._data)))
+        return h
+
+    def __reduce__(self) -> tuple[type[Self], tuple[int, bytes]]:
+        return type(self), (self._size, bytes(self._data))
+
+    def __str__(self) -> str:
+        return f"{type(self).__name__}(size={self._size})"
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(size={self._size}, data={bytes(self._data)!r})"
+
+    @override
+    def size(self) -> int:
+        return self._size
+
+    def hamming(self, other: "BitVector") -> int:
+        "Number of dimensions in which two binary quantized vectors differ."
+
+        if self._size != other._size:
+            raise ValueError(f"expected: vectors of matching size; got: {self._size} and {other._size}")
+
+        # `bit_count` maps to a population count instruction
+        return (int.from_bytes(self._data, "big") ^ int.from_bytes(other._data, "big")).bit_count()
+
+    @override
+    def to_float_list(self) -> list[float]:
+        if not self._size:
+            return []
+
+        bits = int.from_bytes(self._data, "big") >> (-self._size % 8)
+        return list(map(float, format(bits, f"0{self._size}b")))
+
+    @override
+    @classmethod
+    def from_float_list(cls, vec: "Sequence[float] | npt.NDArray[Any]") -> Self:
+        size = len(vec)
+        if _is_numpy_array(vec):
+            import numpy as np
+
+            return cls(size, np.packbits(vec > 0).tobytes())
+
+        # a byte of value 1 for each positive item and 0 otherwise, converted into binary digits;
+        # `operator.lt` falls back to reflected comparison for numeric types other than `float` and `int`, and
+        # `bool` normalizes results such as NumPy booleans
+        digits = bytes(map(bool, map(operator.lt, repeat(0.0), vec))).translate(_BIT_DIGITS)
+        bits = int(digits or b"0", 2) << (-size % 8)
+        return cls(size, bits.to_bytes((size + 7) // 8, "big"))
 
     @override
     def to_database_binary(self) -> bytes:
-        return pack(">iii", self._size, self.nnz(), 0) + self._indices + self._values
+        return _BIT_HEADER.pack(self._size) + self._data
+
+    @override
+    def to_database_binary_into(self, buffer: bytearray | memoryview, offset: int = 0) -> int:
+        _BIT_HEADER.pack_into(buffer, offset, self._size)
+        start = offset + _BIT_HEADER.size
+        end = start + len(self._data)
+        buffer[start:end] = self._data
+        return end
 
     @override
     @classmethod
     def from_database_binary(cls, data: bytes) -> Self:
-        size, count, _ = unpack(">iii", data[0:12])
-        return cls(size, data[12 : 12 + 4 * count], data[12 + 4 * count :])
+        (size,) = _BIT_HEADER.unpack_from(data, 0)
+        return cls(size, memoryview(data)[_BIT_HEADER.size :])
+
+
+async def register_vector(conn: asyncpg.Connection, schema: str = "public", *, bit: bool = False) -> None:
+    """
+    Registers `vector` extension types with Python module `asyncpg`.
+
+    Once registered, query parameters of a vector type accept vector instances, lists of floats and NumPy arrays.
+    Parameters of type `vector` and `halfvec` also accept `bytes` objects already in the PostgreSQL data transfer
+    representation, which allows bulk inserts of embeddings held in a NumPy matrix to bypass per-row conversion:
 
+    ```python
+    records = zip(contents, Vector.encode_batch(embeddings))
+    await conn.copy_records_to_table("items", records=records, columns=["content", "embedding"])
+    ```
 
-async def register_vector(conn: asyncpg.Connection, schema: str = "public") -> None:
-    "Registers `vector` extension types with Python module `asyncpg`."
+    :param bit: Whether to map the built-in type `bit` to `BitVector`, replacing the default `asyncpg` codec.
+    """
 
     await conn.set_type_codec("vector", schema=schema, encoder=Vector._to_database_binary, decoder=Vector._from_database_binary, format="binary")  # pyright: ignore[reportPrivateUsage]
     await conn.set_type_codec("halfvec", schema=schema, encoder=HalfVector._to_database_binary, decoder=HalfVector._from_database_binary, format="binary")  # pyright: ignore[reportPrivateUsage]
     await conn.set_type_codec("sparsevec", schema=schema, encoder=SparseVector._to_database_binary, decoder=SparseVector._from_database_binary, format="binary")  # pyright: ignore[reportPrivateUsage]
+    if bit:
+        await conn.set_type_codec("bit", schema="pg_catalog", encoder=BitVector._to_database_binary, decoder=BitVector._from_database_binary, format="binary")  # pyright: ignore[reportPrivateUsage]
@@ -1,12 +1,17 @@
+import base64
+import importlib.util
 import unittest
 from collections.abc import AsyncIterator, Sequence
 from contextlib import asynccontextmanager
+from decimal import Decimal
+from fractions import Fraction
 from random import random
 from struct import pack, unpack
+from typing import Any
 
 import asyncpg
 
-from asyncpg_vector import HalfVector, SparseVector, Vector, register_vector
+from asyncpg_vector import BitVector, HalfVector, SparseVector, Vector, register_vector
 
 
 @asynccontextmanager
@@ -68,6 +73,95 @@ class TestVector(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(HalfVector.from_float_list(f16d_vector).to_float_list(), f16d_vector)
         self.assertEqual(SparseVector.from_float_list(f32s_vector).to_float_list(), f32s_vector)
 
+        # values out of single-precision range are rejected, infinity is kept
+        with self.assertRaises(OverflowError):
+            Vector.from_float_list([1.0, 1e39])
+        with self.assertRaises(OverflowError):
+            SparseVector.from_float_list([0.0, 1e39])
+        self.assertEqual(Vector.from_float_list([float("inf"), -1.0]).to_float_list(), [float("inf"), -1.0])
+
+        # round trip for read-only sequence
+        self.assertEqual(list(Vector.from_float_list(f32d_vector).to_float_sequence()), f32d_vector)
+        self.assertEqual(list(HalfVector.from_float_list(f16d_vector).to_float_sequence()), f16d_vector)
+        self.assertEqual(list(SparseVector.from_float_list(f32s_vector).to_float_sequence()), f32s_vector)
+
+        # base64-encoded little-endian single-precision floats
+        f32d_base64 = base64.b64encode(pack(f"<{len(f32d_vector)}f", *f32d_vector)).decode("ascii")
+        f16d_base64 = base64.b64encode(pack(f"<{len(f16d_vector)}f", *f16d_vector)).decode("ascii")
+        self.assertEqual(Vector.from_float_base64(f32d_base64).to_float_list(), f32d_vector)
+        self.assertEqual(HalfVector.from_float_base64(f16d_base64).to_float_list(), f16d_vector)
+
+        # round trip for PostgreSQL data transfer representation
+        for vector in [Vector.from_float_list(f32d_vector), HalfVector.from_float_list(f16d_vector), SparseVector.from_float_list(f32s_vector)]:
+            data = vector.to_database_binary()
+            self.assertEqual(type(vector).from_database_binary(data), vector)
+            self.assertEqual(hash(type(vector).from_database_binary(data)), hash(vector))
+            buffer = bytearray(len(data) + 2)
+            self.assertEqual(vector.to_database_binary_into(buffer, 2), len(buffer))
+            self.assertEqual(bytes(buffer[2:]), data)
+
+        # dense vector encoders accept data already in PostgreSQL data transfer representation
+        for dense_vector in [Vector.from_float_list(f32d_vector), HalfVector.from_float_list(f16d_vector)]:
+            data = dense_vector.to_database_binary()
+            self.assertEqual(type(dense_vector)._to_database_binary(data), data)  # pyright: ignore[reportPrivateUsage]
+            with self.assertRaises(ValueError):
+                type(dense_vector)._to_database_binary(data[:-1])  # pyright: ignore[reportPrivateUsage]
+            with self.assertRaises(ValueError):
+                type(dense_vector)._to_database_binary(data[:2])  # pyright: ignore[reportPrivateUsage]
+        with self.assertRaises(ValueError):
+            SparseVector._to_database_binary(SparseVector.from_float_list(f32s_vector).to_database_binary())  # type: ignore[arg-type]  # pyright: ignore[reportPrivateUsage, reportArgumentType]
+
+    async def test_bit(self) -> None:
+        f32d_vector = [random() - 0.5 for _ in range(1535)]
+        bits = [1.0 if value > 0 else 0.0 for value in f32d_vector]
+
+        # binary quantization keeps the sign of each item
+        self.assertEqual(BitVector().size(), 0)
+        self.assertEqual(BitVector.from_float_list(f32d_vector).size(), 1535)
+        self.assertEqual(BitVector.from_float_list(f32d_vector).to_float_list(), bits)
+        self.assertEqual(BitVector.from_float_list([1.0, 0.0, 1.0]).to_database_binary(), pack(">iB", 3, 0b10100000))
+
+        # numeric types other than `float` are compared to zero as well
+        numbers: list[Any] = [Decimal(1), Fraction(-1, 2), 0, 2]
+        self.assertEqual(BitVector.from_float_list(numbers).to_float_list(), [1.0, 0.0, 0.0, 1.0])
+
+        # Hamming distance counts differing bits
+        vector = BitVector.from_float_list(f32d_vector)
+        inverse = BitVector.from_float_list([-value for value in f32d_vector])
+        self.assertEqual(vector.hamming(vector), 0)
+        self.assertEqual(vector.hamming(inverse), 1535)
+        self.assertEqual(BitVector.from_database_binary(vector.to_database_binary()), vector)
+
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "requires numpy")
+    async def test_numpy(self) -> None:
+        import numpy as np
+
+        f32d_vector = to_float32(random_dense())
+        f16d_vector = to_float16(random_dense())
+
+        # round trip for NumPy arrays
+        self.assertEqual(Vector.from_numpy(np.array(f32d_vector, dtype=np.float32)).to_numpy().tolist(), f32d_vector)
+        self.assertEqual(HalfVector.from_numpy(np.array(f16d_vector, dtype=np.float16)).to_numpy().tolist(), f16d_vector)
+
+        # NumPy arrays and lists produce the same representation
+        self.assertEqual(Vector.from_float_list(np.array(f32d_vector)), Vector.from_float_list(f32d_vector))
+        self.assertEqual(HalfVector.from_float_list(np.array(f16d_vector)), HalfVector.from_float_list(f16d_vector))
+        numpy_scalars: list[Any] = [np.float32(1), np.float32(-1)]
+        self.assertEqual(BitVector.from_float_list(numpy_scalars).to_float_list(), [1.0, 0.0])
+
+        # values out of range are rejected as for lists of floats, infinity is kept
+        with self.assertRaises(OverflowError):
+            HalfVector.from_float_list(np.array([1.0, 1e5]))
+        with self.assertRaises(OverflowError):
+            Vector.from_numpy(np.array([1.0, 1e39]))
+        with self.assertRaises(OverflowError):
+            Vector.encode_batch(np.array([[1.0], [1e39]]))
+        self.assertEqual(HalfVector.from_numpy(np.array([np.inf, 1.0])).to_float_list(), [float("inf"), 1.0])
+
+        # batch encoding yields the same representation as individual vectors
+        matrix = np.array([f32d_vector, f32d_vector[::-1]], dtype=np.float32)
+        self.assertEqual(Vector.encode_batch(matrix), [Vector.from_numpy(row).to_database_binary() for row in matrix])
+
     async def test_connection(self) -> None:
         create_sql = """
         --sql
@@ -79,32 +173,34 @@ class TestVector(unittest.IsolatedAsyncioTestCase):
             embedding vector(1536) NOT NULL,
             half_embedding halfvec(1536) NOT NULL,
             sparse_embedding sparsevec(1536) NOT NULL,
+            bit_embedding bit(1536) NOT NULL,
             CONSTRAINT pk_vector_types PRIMARY KEY (id)
         );
         """
 
         insert_sql = """
         --sql
-        INSERT INTO vector_types (embedding, half_embedding, sparse_embedding)
-        VALUES ($1, $2, $3);
+        INSERT INTO vector_types (embedding, half_embedding, sparse_embedding, bit_embedding)
+        VALUES ($1, $2, $3, $4);
         """
 
         select_sql = """
         --sql
-        SELECT embedding, half_embedding, sparse_embedding
+        SELECT embedding, half_embedding, sparse_embedding, bit_embedding
         FROM vector_types
         ORDER BY id;
         """
 
         async with get_connection() as conn:
             await conn.execute(create_sql)
-            await register_vector(conn)
+            await register_vector(conn, bit=True)
 
             records = [
                 (
                     Vector.from_float_list(to_float32(random_dense())),
                     HalfVector.from_float_list(to_float16(random_dense())),
                     SparseVector.from_float_list(to_float32(random_sparse())),
+                    BitVector.from_float_list([value - 0.5 for value in random_dense()]),
                 )
                 for _ in range(1)
             ]
@@ -113,6 +209,47 @@ class TestVector(unittest.IsolatedAsyncioTestCase):
             for row, record in zip(rows, records, strict=True):
                 self.assertEqual(tuple(row), record)
 
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "requires numpy")
+    async def test_connection_batch(self) -> None:
+        import numpy as np
+
+        create_sql = """
+        --sql
+        CREATE EXTENSION IF NOT EXISTS vector;
+
+        --sql
+        CREATE TEMPORARY TABLE vector_batch(
+            id bigint GENERATED ALWAYS AS IDENTITY,
+            content text NOT NULL,
+            embedding vector(1536) NOT NULL,
+            half_embedding halfvec(1536) NOT NULL,
+            CONSTRAINT pk_vector_batch PRIMARY KEY (id)
+        );
+        """
+
+        select_sql = """
+        --sql
+        SELECT content, embedding, half_embedding
+        FROM vector_batch
+        ORDER BY id;
+        """
+
+        async with get_connection() as conn:
+            await conn.execute(create_sql)
+            await register_vector(conn)
+
+            # pre-encoded rows bypass per-row conversion in the encoder
+            contents = [f"item {index}" for index in range(3)]
+            embeddings = np.array([random_dense() for _ in contents], dtype=np.float32)
+            records = zip(contents, Vector.encode_batch(embeddings), HalfVector.encode_batch(embeddings), strict=True)
+            await conn.copy_records_to_table("vector_batch", records=records, columns=["content", "embedding", "half_embedding"])
+
+            rows = await conn.fetch(select_sql)
+            self.assertEqual([row["content"] for row in rows], contents)
+            for row, embedding in zip(rows, embeddings, strict=True):
+                self.assertEqual(row["embedding"], Vector.from_numpy(embedding))
+                self.assertEqual(row["half_embedding"], HalfVector.from_numpy(embedding))
+
 
 if __name__ == "__main__":
     unittest.main()